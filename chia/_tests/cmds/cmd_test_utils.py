@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import io
+import re
 import sys
-from collections.abc import AsyncIterator, Iterable
-from contextlib import asynccontextmanager
+from collections.abc import AsyncIterator, Iterable, Sequence
+from contextlib import AbstractContextManager, asynccontextmanager, nullcontext, redirect_stdout
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional, Union, cast
@@ -431,39 +433,57 @@ def create_service_and_wallet_client_generators(test_rpc_clients: TestRpcClients
     chia.cmds.wallet_funcs.cli_confirm = cli_confirm  # type: ignore[attr-defined]
 
 
-def run_cli_command(capsys: object, chia_root: Path, command_list: list[str]) -> str:
+def run_cli_command(
+    capsys: object, chia_root: Path, command_list: Sequence[str], *, out: Optional[io.StringIO] = None
+) -> str:
     """
     This is just an easy way to run the chia CLI with the given command list.
+    If out is given, stdout is redirected into it in-process instead of being read back from capsys.
     """
     # we don't use the real capsys object because its only accessible in a private part of the pytest module
     exited_cleanly = True
     argv_temp = sys.argv
+    stdout_redirect: AbstractContextManager[object] = nullcontext() if out is None else redirect_stdout(out)
     try:
         sys.argv = ["chia", "--root-path", str(chia_root), *command_list]
-        chia_cli()
+        with stdout_redirect:
+            chia_cli()
     except SystemExit as e:
         if e.code != 0:
             exited_cleanly = False
     finally:  # always reset sys.argv
         sys.argv = argv_temp
     output = capsys.readouterr()  # type: ignore[attr-defined]
-    assert exited_cleanly, f"\n{output.out}\n{output.err}"
-    return str(output.out)
+    stdout = str(output.out) if out is None else out.getvalue()
+    assert exited_cleanly, f"\n{stdout}\n{output.err}"
+    return stdout
 
 
 def cli_assert_shortcut(output: str, strings_to_assert: Iterable[str]) -> None:
     """
     Asserts that all the strings in strings_to_assert are in the output
     """
-    for string_to_assert in strings_to_assert:
+    unique_strings = set(strings_to_assert)
+    if len(unique_strings) == 0:
+        return
+    # one pass over the output for all strings, longest first so a string that is a prefix of another can't shadow it
+    pattern = re.compile("|".join(re.escape(string) for string in sorted(unique_strings, key=len, reverse=True)))
+    found = set(pattern.findall(output))
+    for string_to_assert in unique_strings - found:
+        # matches can't overlap in a single pass, so fall back to a plain search before failing
         assert string_to_assert in output, f"'{string_to_assert}' was not in\n'{output}'"
 
 
 def run_cli_command_and_assert(
-    capsys: object, chia_root: Path, command_list: list[str], strings_to_assert: Iterable[str]
+    capsys: object,
+    chia_root: Path,
+    command_list: Sequence[str],
+    strings_to_assert: Iterable[str],
+    *,
+    out: Optional[io.StringIO] = None,
 ) -> None:
     """
     Runs the command and asserts that all the strings in strings_to_assert are in the output
     """
-    output = run_cli_command(capsys, chia_root, command_list)
+    output = run_cli_command(capsys, chia_root, command_list, out=out)
     cli_assert_shortcut(output, strings_to_assert)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import dataclasses
 import tempfile
 from collections.abc import Iterator
 from pathlib import Path
@@ -10,7 +11,7 @@ from chia._tests.cmds.cmd_test_utils import TestRpcClients, create_service_and_w
 from chia.util.config import create_default_chia_config
 
 
-@pytest.fixture(scope="module")  # every file has its own config generated, just to be safe
+@pytest.fixture(scope="session")
 def get_test_cli_clients() -> Iterator[tuple[TestRpcClients, Path]]:
     # we cant use the normal config fixture because it only supports function scope.
     with tempfile.TemporaryDirectory() as tmp_path:
@@ -18,6 +19,18 @@ def get_test_cli_clients() -> Iterator[tuple[TestRpcClients, Path]]:
         root_path.mkdir(parents=True, exist_ok=True)
         create_default_chia_config(root_path)
         # ^ this is basically the generate config fixture.
-        global_test_rpc_clients = TestRpcClients()
-        create_service_and_wallet_client_generators(global_test_rpc_clients, root_path)
-        yield global_test_rpc_clients, root_path
+        shared_test_rpc_clients = TestRpcClients()
+        create_service_and_wallet_client_generators(shared_test_rpc_clients, root_path)
+        yield shared_test_rpc_clients, root_path
+
+
+@pytest.fixture(autouse=True)
+def _reset_rpc_clients(request: pytest.FixtureRequest) -> None:
+    if "get_test_cli_clients" not in request.fixturenames:
+        return
+    test_rpc_clients, _ = request.getfixturevalue("get_test_cli_clients")
+    # The monkey patched generators (and any module that imported them) hold on to this exact object, so instead of
+    # replacing it we give it fresh clients. This way no client or call log leaks from one test into the next.
+    for client_field in dataclasses.fields(test_rpc_clients):
+        assert client_field.default_factory is not dataclasses.MISSING
+        setattr(test_rpc_clients, client_field.name, client_field.default_factory())
@@ -1,11 +1,22 @@
 from __future__ import annotations
 
 import dataclasses
+import io
 from pathlib import Path
+from types import MethodType
 from typing import Optional
 
+import pytest
+
 from chia._tests.cmds.cmd_test_utils import TestRpcClients, TestWalletRpcClient, logType, run_cli_command_and_assert
-from chia._tests.cmds.wallet.test_consts import FINGERPRINT, FINGERPRINT_ARG, STD_TX, STD_UTX, get_bytes32
+from chia._tests.cmds.wallet.test_consts import (
+    FINGERPRINT,
+    FINGERPRINT_ARG,
+    STD_TX,
+    STD_TX_REMOVALS_TOTAL,
+    STD_UTX,
+    get_bytes32,
+)
 from chia.rpc.wallet_request_types import CombineCoins, CombineCoinsResponse, SplitCoins, SplitCoinsResponse
 from chia.types.blockchain_format.coin import Coin
 from chia.types.blockchain_format.program import Program
@@ -17,6 +28,72 @@ from chia.wallet.util.tx_config import DEFAULT_TX_CONFIG, CoinSelectionConfig, T
 
 test_condition_valid_times: ConditionValidTimes = ConditionValidTimes(min_time=uint64(100), max_time=uint64(150))
 
+_PH0 = Program.to(0).get_tree_hash()
+_PH1 = Program.to(1).get_tree_hash()
+_TEST_COIN = Coin(_PH0, _PH1, uint64(10_000_000_000_000))
+_TEST_COIN_NAME = _TEST_COIN.name()
+_TEST_COIN_RECORD = CoinRecord(_TEST_COIN, uint32(10), uint32(0), False, uint64(0))
+_ZERO_COIN_HEX = bytes(32).hex()
+_BYTES32_ONE = get_bytes32(1)
+_BYTES32_ONE_HEX = _BYTES32_ONE.hex()
+_WALLET_ID = uint32(1)
+_SPLIT_FEE = uint64(1_000_000_000)
+_SPLIT_BASE = ("wallet", "coins", "split", FINGERPRINT_ARG, "-i1", "-m0.001")
+_TIMELOCK_ARGS = ("--valid-at", "100", "--expires-at", "150")
+_EXPECTED_CSC = CoinSelectionConfig(
+    min_coin_amount=uint64(0),
+    max_coin_amount=DEFAULT_TX_CONFIG.max_coin_amount,
+    excluded_coin_amounts=[],
+    excluded_coin_ids=[],
+)
+_EXPECTED_COMBINE_TX_CONFIG = TXConfig(
+    min_coin_amount=uint64(100_000_000_000),
+    max_coin_amount=uint64(200_000_000_000),
+    excluded_coin_amounts=[uint64(300_000_000_000)],
+    excluded_coin_ids=[],
+    reuse_puzhash=False,
+)
+# check_log compares against the logged lists, so these have to stay lists; never mutate them
+_GET_WALLETS_ONCE: list[tuple[object, ...]] = [(None,)]
+_GET_WALLETS_TWICE: list[tuple[object, ...]] = [(None,), (None,)]
+_SYNC_ONCE: list[tuple[object, ...]] = [()]
+_SYNC_TWICE: list[tuple[object, ...]] = [(), ()]
+
+
+def _split_cmd(target_hex: str, *extras: str) -> tuple[str, ...]:
+    return (*_SPLIT_BASE, *extras, f"-t{target_hex}", *_TIMELOCK_ARGS)
+
+
+async def _combine_coins(
+    self: TestWalletRpcClient,
+    args: CombineCoins,
+    tx_config: TXConfig,
+    timelock_info: ConditionValidTimes,
+) -> CombineCoinsResponse:
+    self.add_to_log("combine_coins", (args, tx_config, timelock_info))
+    return CombineCoinsResponse([STD_UTX], [STD_TX])
+
+
+async def _split_coins(
+    self: TestWalletRpcClient, args: SplitCoins, tx_config: TXConfig, timelock_info: ConditionValidTimes
+) -> SplitCoinsResponse:
+    self.add_to_log("split_coins", (args, tx_config, timelock_info))
+    return SplitCoinsResponse([STD_UTX], [STD_TX])
+
+
+async def _get_coin_records_by_names(
+    self: TestWalletRpcClient,
+    names: list[bytes32],
+    include_spent_coins: bool = True,
+    start_height: Optional[int] = None,
+    end_height: Optional[int] = None,
+) -> list[CoinRecord]:
+    if names[0] == _TEST_COIN_NAME:
+        return [_TEST_COIN_RECORD]
+    else:
+        return []
+
+
 # Coin Commands
 
 
@@ -27,51 +104,39 @@ def test_coins_get_info(capsys: object, get_test_cli_clients: tuple[TestRpcClien
 
     inst_rpc_client = TestWalletRpcClient()
     test_rpc_clients.wallet_rpc_client = inst_rpc_client
-    command_args = ["wallet", "coins", "list", FINGERPRINT_ARG, "-i1", "-u"]
+    command_args = ("wallet", "coins", "list", FINGERPRINT_ARG, "-i1", "-u")
     # these are various things that should be in the output
-    assert_list = [
+    assert_list = (
         "There are a total of 3 coins in wallet 1.",
         "2 confirmed coins.",
         "1 unconfirmed additions.",
         "1 unconfirmed removals.",
-    ]
-    run_cli_command_and_assert(capsys, root_dir, command_args, assert_list)
+    )
+    run_cli_command_and_assert(capsys, root_dir, command_args, assert_list, out=io.StringIO())
     expected_calls: logType = {
-        "get_wallets": [(None,)],
-        "get_sync_status": [()],
+        "get_wallets": _GET_WALLETS_ONCE,
+        "get_sync_status": _SYNC_ONCE,
         "get_spendable_coins": [
             (
                 1,
-                CoinSelectionConfig(
-                    min_coin_amount=uint64(0),
-                    max_coin_amount=DEFAULT_TX_CONFIG.max_coin_amount,
-                    excluded_coin_amounts=[],
-                    excluded_coin_ids=[],
-                ),
+                _EXPECTED_CSC,
             )
         ],
     }
     test_rpc_clients.wallet_rpc_client.check_log(expected_calls)
 
 
-def test_coins_combine(capsys: object, get_test_cli_clients: tuple[TestRpcClients, Path]) -> None:
+def test_coins_combine(
+    capsys: object, get_test_cli_clients: tuple[TestRpcClients, Path], monkeypatch: pytest.MonkeyPatch
+) -> None:
     test_rpc_clients, root_dir = get_test_cli_clients
 
     # set RPC Client
-    class CoinsCombineRpcClient(TestWalletRpcClient):
-        async def combine_coins(
-            self,
-            args: CombineCoins,
-            tx_config: TXConfig,
-            timelock_info: ConditionValidTimes,
-        ) -> CombineCoinsResponse:
-            self.add_to_log("combine_coins", (args, tx_config, timelock_info))
-            return CombineCoinsResponse([STD_UTX], [STD_TX])
-
-    inst_rpc_client = CoinsCombineRpcClient()
+    inst_rpc_client = TestWalletRpcClient()
+    monkeypatch.setattr(inst_rpc_client, "combine_coins", MethodType(_combine_coins, inst_rpc_client), raising=False)
     test_rpc_clients.wallet_rpc_client = inst_rpc_client
-    assert sum(coin.amount for coin in STD_TX.removals) < 500_000_000_000
-    command_args = [
+    assert STD_TX_REMOVALS_TOTAL < 500_000_000_000
+    command_args = (
         "wallet",
         "coins",
         "combine",
@@ -88,29 +153,23 @@ def test_coins_combine(capsys: object, get_test_cli_clients: tuple[TestRpcClient
         "--target-amount",
         "1",
         "--input-coin",
-        bytes(32).hex(),
+        _ZERO_COIN_HEX,
         "--valid-at",
         "100",
         "--expires-at",
         "150",
-    ]
+    )
     # these are various things that should be in the output
-    assert_list = ["Fee is >= the amount of coins selected. To continue, please use --override flag."]
-    run_cli_command_and_assert(capsys, root_dir, command_args, assert_list)
-    assert_list = [
+    assert_list: tuple[str, ...] = ("Fee is >= the amount of coins selected. To continue, please use --override flag.",)
+    run_cli_command_and_assert(capsys, root_dir, command_args, assert_list, out=io.StringIO())
+    assert_list = (
         "Transactions would combine up to 500 coins",
         f"To get status, use command: chia wallet get_transaction -f {FINGERPRINT} -tx 0x{STD_TX.name.hex()}",
-    ]
-    run_cli_command_and_assert(capsys, root_dir, [*command_args, "--override"], assert_list)
-    expected_tx_config = TXConfig(
-        min_coin_amount=uint64(100_000_000_000),
-        max_coin_amount=uint64(200_000_000_000),
-        excluded_coin_amounts=[uint64(300_000_000_000)],
-        excluded_coin_ids=[],
-        reuse_puzhash=False,
     )
+    run_cli_command_and_assert(capsys, root_dir, (*command_args, "--override"), assert_list, out=io.StringIO())
+    expected_tx_config = _EXPECTED_COMBINE_TX_CONFIG
     expected_request = CombineCoins(
-        wallet_id=uint32(1),
+        wallet_id=_WALLET_ID,
         number_of_coins=uint16(500),
         largest_first=True,
         target_coin_ids=[bytes32.zeros],
@@ -118,96 +177,80 @@ def test_coins_combine(capsys: object, get_test_cli_clients: tuple[TestRpcClient
         fee=uint64(500_000_000_000),
         push=False,
     )
+    expected_request_pushed = dataclasses.replace(expected_request, push=True)
+    # the first two runs don't push, so they log the exact same call
+    expected_call = (expected_request, expected_tx_config, test_condition_valid_times)
     expected_calls: logType = {
-        "get_wallets": [(None,)] * 2,
-        "get_sync_status": [()] * 2,
+        "get_wallets": _GET_WALLETS_TWICE,
+        "get_sync_status": _SYNC_TWICE,
         "combine_coins": [
-            (
-                expected_request,
-                expected_tx_config,
-                test_condition_valid_times,
-            ),
-            (
-                expected_request,
-                expected_tx_config,
-                test_condition_valid_times,
-            ),
-            (
-                dataclasses.replace(expected_request, push=True),
-                expected_tx_config,
-                test_condition_valid_times,
-            ),
+            expected_call,
+            expected_call,
+            (expected_request_pushed, expected_tx_config, test_condition_valid_times),
         ],
     }
     test_rpc_clients.wallet_rpc_client.check_log(expected_calls)
 
 
-def test_coins_split(capsys: object, get_test_cli_clients: tuple[TestRpcClients, Path]) -> None:
+def _set_split_rpc_client(test_rpc_clients: TestRpcClients, monkeypatch: pytest.MonkeyPatch) -> None:
+    inst_rpc_client = TestWalletRpcClient()
+    monkeypatch.setattr(inst_rpc_client, "split_coins", MethodType(_split_coins, inst_rpc_client), raising=False)
+    monkeypatch.setattr(
+        inst_rpc_client,
+        "get_coin_records_by_names",
+        MethodType(_get_coin_records_by_names, inst_rpc_client),
+        raising=False,
+    )
+    test_rpc_clients.wallet_rpc_client = inst_rpc_client
+
+
+@pytest.mark.parametrize(
+    "extra_args,expected_n,expected_amount,extra_asserts",
+    [
+        (
+            ("-n10", "-a0.0000001"),
+            uint16(10),
+            uint64(100_000),
+            ("WARNING: The amount per coin: 1E-7 is less than the dust threshold: 1e-06.",),
+        ),
+        # split into coins of amount 0.5 XCH or 500_000_000_000 mojo, equivalent to specifying 20 x 0.5xch coins
+        (("-a0.5",), uint16(20), uint64(500_000_000_000), ()),
+        # try the split the other way around, target coin into 20 coins of even amounts
+        (("-n20",), uint16(20), uint64(500_000_000_000), ()),
+    ],
+)
+def test_coins_split_success(
+    capsys: object,
+    get_test_cli_clients: tuple[TestRpcClients, Path],
+    monkeypatch: pytest.MonkeyPatch,
+    extra_args: tuple[str, ...],
+    expected_n: uint16,
+    expected_amount: uint64,
+    extra_asserts: tuple[str, ...],
+) -> None:
     test_rpc_clients, root_dir = get_test_cli_clients
-    test_coin = Coin(Program.to(0).get_tree_hash(), Program.to(1).get_tree_hash(), uint64(10_000_000_000_000))
 
     # set RPC Client
-    class CoinsSplitRpcClient(TestWalletRpcClient):
-        async def split_coins(
-            self, args: SplitCoins, tx_config: TXConfig, timelock_info: ConditionValidTimes
-        ) -> SplitCoinsResponse:
-            self.add_to_log("split_coins", (args, tx_config, timelock_info))
-            return SplitCoinsResponse([STD_UTX], [STD_TX])
-
-        async def get_coin_records_by_names(
-            self,
-            names: list[bytes32],
-            include_spent_coins: bool = True,
-            start_height: Optional[int] = None,
-            end_height: Optional[int] = None,
-        ) -> list[CoinRecord]:
-            cr = CoinRecord(
-                test_coin,
-                uint32(10),
-                uint32(0),
-                False,
-                uint64(0),
-            )
-            if names[0] == test_coin.name():
-                return [cr]
-            else:
-                return []
-
-    inst_rpc_client = CoinsSplitRpcClient()
-    test_rpc_clients.wallet_rpc_client = inst_rpc_client
-    target_coin_id = test_coin.name()
-    command_args = [
-        "wallet",
-        "coins",
-        "split",
-        FINGERPRINT_ARG,
-        "-i1",
-        "-m0.001",
-        "-n10",
-        "-a0.0000001",
-        f"-t{target_coin_id.hex()}",
-        "--valid-at",
-        "100",
-        "--expires-at",
-        "150",
-    ]
+    _set_split_rpc_client(test_rpc_clients, monkeypatch)
+    target_coin_id = _TEST_COIN_NAME
+    command_args = _split_cmd(target_coin_id.hex(), *extra_args)
     # these are various things that should be in the output
-    assert_list = [
+    assert_list = (
         f"To get status, use command: chia wallet get_transaction -f {FINGERPRINT} -tx 0x{STD_TX.name.hex()}",
-        "WARNING: The amount per coin: 1E-7 is less than the dust threshold: 1e-06.",
-    ]
-    run_cli_command_and_assert(capsys, root_dir, command_args, assert_list)
+        *extra_asserts,
+    )
+    run_cli_command_and_assert(capsys, root_dir, command_args, assert_list, out=io.StringIO())
     expected_calls: logType = {
-        "get_wallets": [(None,)],
-        "get_sync_status": [()],
+        "get_wallets": _GET_WALLETS_ONCE,
+        "get_sync_status": _SYNC_ONCE,
         "split_coins": [
             (
                 SplitCoins(
-                    wallet_id=uint32(1),
-                    number_of_coins=uint16(10),
-                    amount_per_coin=uint64(100_000),
+                    wallet_id=_WALLET_ID,
+                    number_of_coins=expected_n,
+                    amount_per_coin=expected_amount,
                     target_coin_id=target_coin_id,
-                    fee=uint64(1_000_000_000),
+                    fee=_SPLIT_FEE,
                     push=True,
                 ),
                 DEFAULT_TX_CONFIG,
@@ -217,108 +260,33 @@ def test_coins_split(capsys: object, get_test_cli_clients: tuple[TestRpcClients,
     }
     test_rpc_clients.wallet_rpc_client.check_log(expected_calls)
 
-    command_args = [
-        "wallet",
-        "coins",
-        "split",
-        FINGERPRINT_ARG,
-        "-i1",
-        "-m0.001",
-        "-a0.5",  # split into coins of amount 0.5 XCH or 500_000_000_000 mojo
-        f"-t{target_coin_id.hex()}",
-        "--valid-at",
-        "100",
-        "--expires-at",
-        "150",
-    ]
-    assert_list = []
-    run_cli_command_and_assert(capsys, root_dir, command_args, assert_list)
-    expected_calls = {
-        "get_wallets": [(None,)],
-        "get_sync_status": [()],
-        "split_coins": [
-            (
-                SplitCoins(
-                    wallet_id=uint32(1),
-                    number_of_coins=uint16(
-                        20
-                    ),  # this transaction should be equivalent to specifying 20 x  0.5xch coins
-                    amount_per_coin=uint64(500_000_000_000),
-                    target_coin_id=target_coin_id,
-                    fee=uint64(1_000_000_000),
-                    push=True,
-                ),
-                DEFAULT_TX_CONFIG,
-                test_condition_valid_times,
-            )
-        ],
-    }
-    test_rpc_clients.wallet_rpc_client.check_log(expected_calls)
-    # try the split the other way around
-    command_args = [
-        "wallet",
-        "coins",
-        "split",
-        FINGERPRINT_ARG,
-        "-i1",
-        "-m0.001",
-        "-n20",  # split target coin into 20 coins of even amounts
-        f"-t{target_coin_id.hex()}",
-        "--valid-at",
-        "100",
-        "--expires-at",
-        "150",
-    ]
-    run_cli_command_and_assert(capsys, root_dir, command_args, assert_list)
-    test_rpc_clients.wallet_rpc_client.check_log(expected_calls)
+
+def test_coins_split_missing_inputs(
+    capsys: object, get_test_cli_clients: tuple[TestRpcClients, Path], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    test_rpc_clients, root_dir = get_test_cli_clients
+
+    # set RPC Client
+    _set_split_rpc_client(test_rpc_clients, monkeypatch)
     # Test missing both inputs
-    command_args = [
-        "wallet",
-        "coins",
-        "split",
-        FINGERPRINT_ARG,
-        "-i1",
-        "-m0.001",
-        f"-t{target_coin_id.hex()}",
-        "--valid-at",
-        "100",
-        "--expires-at",
-        "150",
-    ]
+    command_args = _split_cmd(_TEST_COIN_NAME.hex())
     # these are various things that should be in the output
-    assert_list = ["Must use either -a or -n. For more information run --help."]
-    run_cli_command_and_assert(capsys, root_dir, command_args, assert_list)
+    assert_list = ("Must use either -a or -n. For more information run --help.",)
+    run_cli_command_and_assert(capsys, root_dir, command_args, assert_list, out=io.StringIO())
 
-    # Test missing coin not found both ways
-    target_coin_id = get_bytes32(1)
-    assert_list = ["Could not find target coin."]
-    command_args = [
-        "wallet",
-        "coins",
-        "split",
-        FINGERPRINT_ARG,
-        "-i1",
-        "-m0.001",
-        "-n20",  # split target coin into 20 coins of even amounts
-        f"-t{target_coin_id.hex()}",
-        "--valid-at",
-        "100",
-        "--expires-at",
-        "150",
-    ]
-    run_cli_command_and_assert(capsys, root_dir, command_args, assert_list)
-    command_args = [
-        "wallet",
-        "coins",
-        "split",
-        FINGERPRINT_ARG,
-        "-i1",
-        "-m0.001",
-        "-a0.5",  # split into coins of amount 0.5 XCH or 500_000_000_000 mojo
-        f"-t{target_coin_id.hex()}",
-        "--valid-at",
-        "100",
-        "--expires-at",
-        "150",
-    ]
-    run_cli_command_and_assert(capsys, root_dir, command_args, assert_list)
+
+# Test missing coin not found both ways
+@pytest.mark.parametrize("extra_arg", ["-n20", "-a0.5"])
+def test_coins_split_target_not_found(
+    capsys: object,
+    get_test_cli_clients: tuple[TestRpcClients, Path],
+    monkeypatch: pytest.MonkeyPatch,
+    extra_arg: str,
+) -> None:
+    test_rpc_clients, root_dir = get_test_cli_clients
+
+    # set RPC Client
+    _set_split_rpc_client(test_rpc_clients, monkeypatch)
+    assert_list = ("Could not find target coin.",)
+    command_args = _split_cmd(_BYTES32_ONE_HEX, extra_arg)
+    run_cli_command_and_assert(capsys, root_dir, command_args, assert_list, out=io.StringIO())
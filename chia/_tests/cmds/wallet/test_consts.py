@@ -42,6 +42,7 @@ STD_TX = TransactionRecord(
     memos=[(get_bytes32(3), [bytes([4] * 32)])],
     valid_times=ConditionValidTimes(),
 )
+STD_TX_REMOVALS_TOTAL: int = sum(coin.amount for coin in STD_TX.removals)
 
 
 STD_UTX = UnsignedTransaction(TransactionInfo([]), SigningInstructions(KeyHints([], []), []))